@@ -8,11 +8,13 @@ with modification in the future, as it is currently unregulated.
 from __future__ import annotations
 
 from pathlib import Path
-
-import toml
+from typing import TYPE_CHECKING
 
 from spacecat.helpers import constants
 
+if TYPE_CHECKING:
+    from spacecat.instance import Instance
+
 
 def get() -> list[str]:
     """
@@ -41,7 +43,7 @@ def get() -> list[str]:
     return modulelist
 
 
-def get_enabled() -> list[str]:
+def get_enabled(instance: Instance) -> list[str]:
     """
     Get a list of enabled modules.
 
@@ -49,13 +51,16 @@ def get_enabled() -> list[str]:
     configuration file. It then compares the list of modules with the
     list of disabled modules to determine which ones are enabled.
 
+    Args:
+        instance (Instance): The bot instance to read the config of.
+
     Returns:
         list[str]: A list of enabled modules.
 
     """
     # Fetch all modules and disabled modules
     modules = get()
-    disabled_modules = get_disabled()
+    disabled_modules = get_disabled(instance)
     enabled_modules: list[str] = []
 
     # Compare with disabled modules list to determine which ones are enabled
@@ -67,20 +72,22 @@ def get_enabled() -> list[str]:
     return enabled_modules
 
 
-def get_disabled() -> list[str]:
+def get_disabled(instance: Instance) -> list[str]:
     """
-    Get a list of disabled modules from the config file.
+    Get a list of disabled modules from the config.
+
+    This function fetches the list of disabled modules from the
+    instance's config, which is held in memory after the first read.
 
-    This function fetches the list of disabled modules from the config
-    file located at the instance's `config.toml` file.
+    Args:
+        instance (Instance): The bot instance to read the config of.
 
     Returns:
         list[str]: A list of disabled modules, empty if no modules are
             disabled.
     """
-    # Fetch disabled modules from config file
+    # Fetch disabled modules from the instance config
     try:
-        config = toml.load(f"{constants.DATA_DIR}/config.toml")
-        return config["base"]["disabled_modules"]
+        return list(instance.get_config_value("base", "disabled_modules"))
     except (KeyError, FileNotFoundError):
         return []
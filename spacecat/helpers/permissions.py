@@ -16,15 +16,15 @@ import sqlite3
 from typing import TYPE_CHECKING, cast
 
 import discord
-import toml
 from discord.ext import commands
 
 import spacecat.spacecat
-from spacecat.helpers import constants
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from spacecat.instance import Instance
+
 
 def init_database(db: sqlite3.Connection) -> None:
     """
@@ -88,7 +88,7 @@ def check() -> Callable:
             interaction.guild, interaction.user, permissions, cursor
         )
         default_result = _default_permission_check(
-            interaction.guild, permissions, bot.instance.get_config(), cursor
+            interaction.guild, permissions, bot.instance, cursor
         )
         if user_result or role_result or default_result:
             return True
@@ -107,11 +107,12 @@ def exclusive() -> Callable:
     """
 
     def predicate(ctx: commands.Context) -> bool:
-        # Open global config file
-        config = toml.load(constants.DATA_DIR + "config.toml")
+        # Get bot administrators from the bot instance config
+        bot = cast(spacecat.spacecat.SpaceCat, ctx.bot)
+        admin_users = bot.instance.get_config_value("base", "adminuser")
 
         # If user is the bot administrator
-        if ctx.author.id in config["base"]["adminuser"]:
+        if ctx.author.id in admin_users:
             return True
         return False
 
@@ -185,7 +186,7 @@ def _role_permission_check(
 def _default_permission_check(
     guild: discord.Guild,
     permissions: list[str],
-    config: dict,
+    instance: Instance,
     cursor: sqlite3.Cursor,
 ) -> bool:
     """
@@ -199,7 +200,7 @@ def _default_permission_check(
         guild (discord.Guild): The guild to check for default
             permissions.
         permissions (list[str]): The permissions to check.
-        config (dict): The server configuration.
+        instance (Instance): The bot instance holding the config.
         cursor (sqlite3.Cursor): The cursor to execute the SQL query.
 
     Returns:
@@ -209,7 +210,8 @@ def _default_permission_check(
     cursor.execute("SELECT disable_default_permissions FROM server_settings WHERE id=?", query)
     default_permissions = cursor.fetchone()
     if default_permissions == 0:
-        comparison = set(config["base"]["default_permissions"]).intersection(permissions)
+        default_commands = instance.get_config_value("base", "default_permissions")
+        comparison = set(default_commands).intersection(permissions)
         if comparison:
             return True
     return False
@@ -9,6 +9,8 @@ the same host.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import os
 import shutil
 import sqlite3
@@ -90,6 +92,8 @@ class Instance:
     def __init__(self: Instance, name: str) -> None:
         """Initialize the InstanceData class."""
         self._name: str = name
+        self._config: dict[str, Any] | None = None
+        self._config_write_lock = asyncio.Lock()
         self._init_config()
 
     @property
@@ -126,10 +130,36 @@ class Instance:
         """
         Read and return the config values.
 
+        The config file is only parsed on first access, with subsequent
+        calls being served from memory. A copy is returned so that
+        changes only take effect once passed to `save_config`. Edits
+        made to the file by hand are not seen until `reload_config`.
+
         Returns:
             dict: The config dictionary.
         """
-        return toml.load(self.instance_location + "config.toml")
+        if self._config is None:
+            self._config = toml.load(self.instance_location + "config.toml")
+        return copy.deepcopy(self._config)
+
+    def get_config_value(self: Self, section: str, key: str) -> Any:  # noqa: ANN401
+        """
+        Read a single value from the config.
+
+        Unlike `get_config`, the config is not copied, which makes this
+        suitable for values that are checked frequently. The returned
+        value should not be modified.
+
+        Args:
+            section (str): The config section containing the value.
+            key (str): The key of the value within the section.
+
+        Returns:
+            Any: The config value.
+        """
+        if self._config is None:
+            self._config = toml.load(self.instance_location + "config.toml")
+        return self._config[section][key]
 
     def save_config(self: Self, config: dict) -> None:
         """
@@ -139,8 +169,39 @@ class Instance:
             path (str): The path to the config file.
             config (dict): The config dictionary.
         """
-        with Path(self.instance_location + "config.toml").open("w") as config_file:
-            toml.dump(config, config_file)
+        self._write_config(config)
+        self._config = copy.deepcopy(config)
+
+    async def save_config_async(self: Self, config: dict) -> None:
+        """
+        Write the config to file without blocking the event loop.
+
+        The config held in memory is updated straight away, so that
+        reads made while the file is being written see the change.
+        Writes are made one at a time in a worker thread.
+
+        Args:
+            config (dict): The config dictionary.
+        """
+        self._config = copy.deepcopy(config)
+        async with self._config_write_lock:
+            await asyncio.to_thread(self._write_config, copy.deepcopy(self._config))
+
+    async def reload_config(self: Self) -> None:
+        """
+        Discard the config held in memory and read it again from file.
+
+        The file is read once any pending writes have finished. If the
+        file fails to parse, the config held in memory is left as is.
+
+        Raises:
+            FileNotFoundError: If the config file does not exist.
+            toml.TomlDecodeError: If the config file is not valid TOML.
+        """
+        async with self._config_write_lock:
+            self._config = await asyncio.to_thread(
+                toml.load, self.instance_location + "config.toml"
+            )
 
     def get_database(self: Self) -> sqlite3.Connection:
         """
@@ -151,6 +212,10 @@ class Instance:
         """
         return sqlite3.connect(self.instance_location + "database.db")
 
+    def _write_config(self: Self, config: dict) -> None:
+        with Path(self.instance_location + "config.toml").open("w") as config_file:
+            toml.dump(config, config_file)
+
     def _init_config(self: Self) -> None:
         try:
             config = self.get_config()
@@ -159,5 +224,4 @@ class Instance:
 
         if "base" not in config:
             config["base"] = {}
-
-        self.save_config(config)
+            self.save_config(config)
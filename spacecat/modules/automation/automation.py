@@ -114,7 +114,9 @@ class Automation(commands.Cog):
             config["automation"]["max_events_per_server"] = 10
         if "max_actions_per_event" not in config["automation"]:
             config["automation"]["max_actions_per_event"] = 15
-        self.bot.instance.save_config(config)
+
+        if config != self.bot.instance.get_config():
+            await self.bot.instance.save_config_async(config)
 
     def init_event_service(self: Self) -> event_scheduler.EventService:
         """
@@ -45,7 +45,8 @@ class Configuration(commands.Cog):
         except KeyError:
             config["permissions"]["default"] = []
 
-        self.bot.instance.save_config(config)
+        if config != self.bot.instance.get_config():
+            await self.bot.instance.save_config_async(config)
 
     @app_commands.command()
     @permissions.exclusive()
@@ -79,8 +80,10 @@ class Configuration(commands.Cog):
         else:
             await self.bot.change_presence(status=status)
 
+        # Read config again as it may have changed while updating presence
+        config = self.bot.instance.get_config()
         config["base"]["status"] = status.name
-        self.bot.instance.save_config(config)
+        await self.bot.instance.save_config_async(config)
 
     @app_commands.command()
     @permissions.exclusive()
@@ -122,9 +125,11 @@ class Configuration(commands.Cog):
         else:
             await self.bot.change_presence(activity=activity)
 
+        # Read config again as it may have changed while updating presence
+        config = self.bot.instance.get_config()
         config["base"]["activity_type"] = activity_type.name
         config["base"]["activity_name"] = name
-        self.bot.instance.save_config(config)
+        await self.bot.instance.save_config_async(config)
 
 
 async def setup(bot: SpaceCat) -> None:
@@ -51,6 +51,8 @@ class Song(ABC):
     necessary abstract methods that must be implemented by subclasses.
     """
 
+    __slots__ = ()
+
     @classmethod
     @abstractmethod
     async def from_query(
@@ -67,6 +69,23 @@ class Song(ABC):
             Self: A song object created from the query.
         """
 
+    @classmethod
+    @abstractmethod
+    async def search(
+        cls: type[Self], query: str, requester: discord.abc.User, limit: int
+    ) -> tuple[Self, ...]:
+        """
+        Creates song objects from the top results of a search query.
+
+        Parameters:
+            query (str): The query used to search for tracks.
+            requester (discord.abc.User): The user requesting the tracks.
+            limit (int): The maximum number of results to create.
+
+        Returns:
+            tuple[Self, ...]: Song objects for the top search results.
+        """
+
     @property
     @abstractmethod
     def stream(self: Self) -> object:
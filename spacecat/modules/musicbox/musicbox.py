@@ -11,9 +11,10 @@ voice channel with the bot, and shouldn't be used in DMs.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+import functools
 import sqlite3
-import uuid
 from typing import TYPE_CHECKING, Self
 
 import discord
@@ -47,7 +48,11 @@ MINIMUM_QUEUE_SIZE = 2
 MAX_PLAYLIST_NAME_LENGTH = 30
 MAX_PLAYLIST_DESCRIPTION_LENGTH = 300
 MAX_DISPLAY_SONG_NAME_LENGTH = 90
+MAX_DISPLAY_UNAVAILABLE_SONGS = 10
 PLAYLIST_SONG_LIMIT = 100
+MAX_CONCURRENT_SONG_SEARCHES = 8
+MAX_SEARCH_RESULTS = 5
+SEARCH_CACHE_CAPACITY = 500
 
 VocalGuildChannel = discord.VoiceChannel | discord.StageChannel
 
@@ -76,6 +81,11 @@ class Musicbox(commands.Cog):
         description="I'm not in a supported voice channel.",
     )
 
+    SONG_UNAVAILABLE_EMBED = discord.Embed(
+        colour=constants.EmbedStatus.FAIL.value,
+        description="That song is unavailable. Maybe the link is invalid?",
+    )
+
     def __init__(self: Musicbox, bot: SpaceCat) -> None:
         """
         Initializes a new instance of the Musicbox class.
@@ -85,7 +95,12 @@ class Musicbox(commands.Cog):
         """
         self.bot = bot
         self.music_players: dict[int, MusicPlayer] = {}
+        self.music_player_locks: dict[int, asyncio.Lock] = {}
         self.database = sqlite3.connect(constants.DATA_DIR + "spacecat.db")
+        self.database.execute("PRAGMA journal_mode=WAL")
+        self.database.execute("PRAGMA synchronous=NORMAL")
+        self.database.execute("PRAGMA temp_store=MEMORY")
+        self.database.execute("PRAGMA cache_size=-8000")
         self.playlists = PlaylistRepository(self.database)
         self.playlist_songs = PlaylistSongRepository(self.database)
         self.player_type = "wavelink"
@@ -95,13 +110,18 @@ class Musicbox(commands.Cog):
         await self.init_config()
         await self.init_wavelink()
 
+    async def cog_unload(self: Self) -> None:
+        """Closes the playlist database connection on cog unload."""
+        self.database.close()
+
     async def init_config(self: Self) -> None:
         """
         Initialises configuration settings for the music streaming.
 
         Loads the config file, sets default values for lavalink
-        address, port, and password if not present, and writes the
-        updated config back to the file.
+        address, port, and password, as well as music disconnect
+        settings if not present. The config file is only written back
+        when a default value had to be added.
         """
         config = self.bot.instance.get_config()
         if "lavalink" not in config:
@@ -112,8 +132,15 @@ class Musicbox(commands.Cog):
             config["lavalink"]["port"] = "2333"
         if "password" not in config["lavalink"]:
             config["lavalink"]["password"] = "password1"  # noqa: S105
+        if "music" not in config:
+            config["music"] = {}
+        if "auto_disconnect" not in config["music"]:
+            config["music"]["auto_disconnect"] = True
+        if "disconnect_time" not in config["music"]:
+            config["music"]["disconnect_time"] = 300
 
-        self.bot.instance.save_config(config)
+        if config != self.bot.instance.get_config():
+            await self.bot.instance.save_config_async(config)
 
     async def init_wavelink(self: Self) -> None:
         """
@@ -122,55 +149,43 @@ class Musicbox(commands.Cog):
         This function loads the configuration settings from the
         instance's config. It creates a Wavelink node using the provided
         address, port, and password. Then, it connects the Wavelink
-        client to the node using the provided Discord bot.
+        client to the node using the provided Discord bot, with recent
+        track searches cached so that repeated queries skip Lavalink.
         """
         config = self.bot.instance.get_config()
         node = wavelink.Node(
             uri=f"{config['lavalink']['address']}:{config['lavalink']['port']}",
             password=config["lavalink"]["password"],
         )
-        await wavelink.Pool.connect(nodes=[node], client=self.bot)
-
-    @commands.Cog.listener()
-    async def on_ready(self: Self) -> None:
-        """Initialises configurations on cog load."""
-        # Add config keys
-        config = self.bot.instance.get_config()
-        if "music" not in config:
-            config["music"] = {}
-        if "auto_disconnect" not in config["music"]:
-            config["music"]["auto_disconnect"] = True
-        if "disconnect_time" not in config["music"]:
-            config["music"]["disconnect_time"] = 300
-        self.bot.instance.save_config(config)
+        await wavelink.Pool.connect(
+            nodes=[node], client=self.bot, cache_capacity=SEARCH_CACHE_CAPACITY
+        )
 
     @commands.Cog.listener()
     async def on_voice_state_update(
         self: Self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState
     ) -> None:
         """Disconnect the bot if the last user leaves the channel."""
-        # If bot disconnects from voice, remove music player
+        # If bot disconnects from voice, remove music player and its creation lock
         if self.bot.user and member.id == self.bot.user.id and after.channel is None:
-            try:
-                music_player = self.music_players.pop(member.guild.id)
+            music_player = self.music_players.pop(member.guild.id, None)
+            self.music_player_locks.pop(member.guild.id, None)
+            if music_player is not None:
                 await music_player.disable_auto_disconnect()
-            except KeyError:
-                pass
 
         # Check if bot voice client isn't active
         voice_client = member.guild.voice_client
         if not voice_client or not isinstance(voice_client.channel, VocalGuildChannel):
             return
 
-        # Check if auto channel disconnect is disabled
-        config = self.bot.instance.get_config()
-        if not config["music"]["auto_disconnect"]:
-            return
-
         # Check if user isn't in same channel or not a disconnect/move event
         if voice_client.channel != before.channel or before.channel == after.channel:
             return
 
+        # Check if auto channel disconnect is disabled
+        if not self.bot.instance.get_config_value("music", "auto_disconnect"):
+            return
+
         # Disconnect if the bot is the only user left
         min_users = 2
         if len(voice_client.channel.members) < min_users:
@@ -185,10 +200,13 @@ class Musicbox(commands.Cog):
             payload (wavelink.TrackEndEventPayload): The payload
                 containing information about the track that ended.
         """
-        if payload.player is None:
+        if payload.player is None or payload.player.guild is None:
             return
 
-        music_player = await self._get_music_player(payload.player.channel)
+        # Ignore tracks ending on players that have already been removed
+        music_player = self.music_players.get(payload.player.guild.id)
+        if music_player is None:
+            return
         await music_player.process_song_end()
 
     queue_group = app_commands.Group(
@@ -211,11 +229,7 @@ class Musicbox(commands.Cog):
         """Joins a voice channel."""
         # Alert if user is not running command in server
         if interaction.guild is None or not isinstance(interaction.user, discord.Member):
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.FAIL.value,
-                description="You can't run this command in DMs.",
-            )
-            await interaction.response.send_message(embed=embed)
+            await interaction.response.send_message(embed=self.NOT_IN_SERVER_EMBED)
             return
 
         # Set channel to join to specified, otherwise use user's current channel
@@ -294,8 +308,9 @@ class Musicbox(commands.Cog):
         if music_player is None or voice_channel is None:
             return
 
-        if position > len(music_player.next_queue) or position < 1:
-            position = len(music_player.next_queue) + 1
+        queue_length = len(music_player.next_queue)
+        if position > queue_length or position < 1:
+            position = queue_length + 1
 
         # Defer response due to long processing times when provided a large playlist
         await interaction.response.defer()
@@ -303,11 +318,7 @@ class Musicbox(commands.Cog):
         try:
             songs = await self._get_songs(url, interaction.user)
         except SongUnavailableError:
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.FAIL.value,
-                description="That song is unavailable. Maybe the link is invalid?",
-            )
-            await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embed=self.SONG_UNAVAILABLE_EMBED)
             return
 
         if not songs:
@@ -338,7 +349,7 @@ class Musicbox(commands.Cog):
         else:
             song = songs[0]
             result = await music_player.add(song, position - 1)
-            duration = await self._format_duration(song.duration)
+            duration = self._format_duration(song.duration)
             artist = f"{song.artist} - " if song.artist else ""
             song_name = f"[{artist}{song.title}]({song.url}) `{duration}`"
             embed_description = (
@@ -356,8 +367,9 @@ class Musicbox(commands.Cog):
     async def playsearch(self: Self, interaction: discord.Interaction, search: str) -> None:
         """Queries a list of songs to play."""
         # Alert user if search term returns no results
-        songs = await self._get_songs(search, interaction.user)
-        if not songs:
+        try:
+            songs = await self._search_songs(search, interaction.user, MAX_SEARCH_RESULTS)
+        except SongUnavailableError:
             embed = discord.Embed(
                 colour=constants.EmbedStatus.FAIL.value,
                 description="Search query returned no results",
@@ -365,18 +377,17 @@ class Musicbox(commands.Cog):
             await interaction.response.send_message(embed=embed)
             return
 
-        # Format the data to be in a usable list
-        results_format = [
-            f"{i+1}. [{song.title}]({song.url}) `{song.duration}`"
-            for i, song in enumerate(songs[:5])
-        ]
+        # Format the results directly into the output text
+        results_output = "\n".join(
+            f"{index}. [{song.title}]({song.url}) `{self._format_duration(song.duration)}`"
+            for index, song in enumerate(songs, start=1)
+        )
 
         # Output results to chat
         embed = discord.Embed(
             colour=constants.EmbedStatus.INFO.value,
             title=f"{constants.EmbedIcon.MUSIC} Search Query",
         )
-        results_output = "\n".join(results_format)
         embed.add_field(name=f"Results for '{search}'", value=results_output, inline=False)
         await interaction.response.send_message(embed=embed)
 
@@ -616,8 +627,8 @@ class Musicbox(commands.Cog):
             return
 
         # Output playing song
-        duration = await self._format_duration(song.duration)
-        current_time = await self._format_duration(music_player.seek_position)
+        duration = self._format_duration(song.duration)
+        current_time = self._format_duration(music_player.seek_position)
         artist = ""
         if song.artist:
             artist = f"{song.artist} - "
@@ -693,8 +704,8 @@ class Musicbox(commands.Cog):
         )
         header = "Currently Playing (Looping)" if music_player.is_looping else "Currently Playing"
         artist = f"{playing.artist} - " if playing.artist else ""
-        current_time = await self._format_duration(music_player.seek_position)
-        duration = await self._format_duration(playing.duration)
+        current_time = self._format_duration(music_player.seek_position)
+        duration = self._format_duration(playing.duration)
         spacer = "\u200b" if len(queue) >= 1 else ""
         embed.add_field(
             name=header,
@@ -702,20 +713,14 @@ class Musicbox(commands.Cog):
             f"`{current_time}/{duration}` \n{spacer}",
         )
 
-        # List songs in queue and calculate the total duration
-        queue_display_items = []
-        total_duration = 0
-        for song in queue:
-            total_duration += song.duration
-            duration = await self._format_duration(song.duration)
-            artist = f"{song.artist} - " if song.artist else ""
-            queue_display_items.append(
-                f"[{artist}{song.title}]({song.url}) `{duration}` | " f"<@{playing.requester_id}>"
-            )
+        # List songs in queue
+        queue_display_items = [
+            f"{self._format_queue_song(song)} | <@{song.requester_id}>" for song in queue
+        ]
 
         # Output results to chat
         if queue_display_items:
-            duration = await self._format_duration(total_duration)
+            duration = self._format_duration(sum(song.duration for song in queue))
             paginated_view = PaginatedView(
                 embed, f"Queue  `{duration}`", queue_display_items, 5, page
             )
@@ -752,8 +757,8 @@ class Musicbox(commands.Cog):
         )
         header = "Currently Playing (Looping)" if music_player.is_looping else "Currently Playing"
         artist = f"{playing.artist} - " if playing.artist else ""
-        current_time = await self._format_duration(music_player.seek_position)
-        duration = await self._format_duration(playing.duration)
+        current_time = self._format_duration(music_player.seek_position)
+        duration = self._format_duration(playing.duration)
         spacer = "\u200b" if len(queue) >= 1 else ""
         embed.add_field(
             name=header,
@@ -761,18 +766,12 @@ class Musicbox(commands.Cog):
             f"`{current_time}/{duration}` \n{spacer}",
         )
 
-        # List remaining songs in queue plus total duration
-        queue_display_items = []
-        total_duration = 0
-        for song in queue:
-            total_duration += song.duration
-            duration = await self._format_duration(song.duration)
-            artist = f"{song.artist} - " if song.artist else ""
-            queue_display_items.append(f"[{artist}{song.title}]({song.url}) `{duration}`")
+        # List remaining songs in queue
+        queue_display_items = [self._format_queue_song(song) for song in queue]
 
         # Output results to chat
         if queue_display_items:
-            duration = await self._format_duration(total_duration)
+            duration = self._format_duration(sum(song.duration for song in queue))
             paginated_view = PaginatedView(
                 embed, f"Queue  `{duration}`", queue_display_items, 5, page
             )
@@ -816,7 +815,7 @@ class Musicbox(commands.Cog):
         await music_player.move(original_pos - 1, new_pos - 1)
 
         # Output result to chat
-        duration = await self._format_duration(song.duration)
+        duration = self._format_duration(song.duration)
         embed = discord.Embed(
             colour=constants.EmbedStatus.YES.value,
             description=f"[{song.title}]({song.url}) `{duration}` has been moved from "
@@ -844,7 +843,7 @@ class Musicbox(commands.Cog):
         await music_player.remove(position - 1)
 
         # Output result to chat
-        duration = await self._format_duration(song.duration)
+        duration = self._format_duration(song.duration)
         embed = discord.Embed(
             colour=constants.EmbedStatus.YES.value,
             description=f"[{song.title}]({song.url}) `{duration}` "
@@ -926,21 +925,14 @@ class Musicbox(commands.Cog):
         playlist = self.playlists.get_by_name_in_guild(playlist_name, interaction.guild)
         if not playlist:
             await interaction.response.send_message(
-                embed=discord.Embed(
-                    colour=constants.EmbedStatus.FAIL.value,
-                    description=f"Playlist `{playlist_name}` doesn't exist",
-                )
+                embed=self._create_playlist_not_found_embed(playlist_name)
             )
             return
 
-        # Remove all playlist songs
-        playlist_songs = self.playlist_songs.get_by_playlist(playlist.id)
-        if playlist_songs:
-            for song in playlist_songs:
-                self.playlist_songs.remove(song.id)
-
-        # Remove the playlist itself
-        self.playlists.remove(playlist.id)
+        # Remove all playlist songs and the playlist itself in one transaction
+        with self.database:
+            self.playlist_songs.remove_by_playlist(playlist.id, commit=False)
+            self.playlists.remove(playlist.id, commit=False)
         embed = discord.Embed(
             colour=constants.EmbedStatus.YES.value,
             description=f"Playlist `{playlist_name}` has been destroyed",
@@ -960,10 +952,7 @@ class Musicbox(commands.Cog):
         # Alert if playlist doesn't exist
         playlist = self.playlists.get_by_name_in_guild(playlist_name, interaction.guild)
         if not playlist:
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.FAIL.value,
-                description=f"Playlist '{playlist_name}' doesn't exist",
-            )
+            embed = self._create_playlist_not_found_embed(playlist_name)
             await interaction.response.send_message(embed=embed)
             return
 
@@ -976,12 +965,9 @@ class Musicbox(commands.Cog):
             await interaction.response.send_message(embed=embed)
             return
 
-        # Update playlist last modified
-        playlist.modified_date = datetime.datetime.now(tz=datetime.UTC)
-        self.playlists.update(playlist)
-
-        # Update playlist description
+        # Update playlist description and last modified
         playlist.description = description
+        playlist.modified_date = datetime.datetime.now(tz=datetime.UTC)
         self.playlists.update(playlist)
         embed = discord.Embed(
             colour=constants.EmbedStatus.YES.value,
@@ -1002,19 +988,13 @@ class Musicbox(commands.Cog):
         # Get the playlist
         playlist = self.playlists.get_by_name_in_guild(playlist_name, interaction.guild)
         if not playlist:
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.FAIL.value,
-                description=f"Playlist '{playlist_name}' doesn't exist",
-            )
+            embed = self._create_playlist_not_found_embed(playlist_name)
             await interaction.response.send_message(embed=embed)
             return
 
-        # Update playlist last modified
-        playlist.modified_date = datetime.datetime.now(tz=datetime.UTC)
-        self.playlists.update(playlist)
-
-        # Update playlist name
+        # Update playlist name and last modified
         playlist.name = new_name
+        playlist.modified_date = datetime.datetime.now(tz=datetime.UTC)
         self.playlists.update(playlist)
         embed = discord.Embed(
             colour=constants.EmbedStatus.YES.value,
@@ -1030,8 +1010,8 @@ class Musicbox(commands.Cog):
             await interaction.response.send_message(embed=self.NOT_IN_SERVER_EMBED)
             return
 
-        # Get playlist from repo
-        playlists = self.playlists.get_by_guild(interaction.guild)
+        # Get playlists along with their total durations from repo
+        playlists = self.playlists.get_by_guild_with_duration(interaction.guild)
         if not playlists:
             embed = discord.Embed(
                 colour=constants.EmbedStatus.FAIL.value,
@@ -1042,12 +1022,8 @@ class Musicbox(commands.Cog):
 
         # Format playlist info
         playlist_info = []
-        for playlist in playlists:
-            songs = self.playlist_songs.get_by_playlist(playlist.id)
-            song_duration = 0
-            for song in songs:
-                song_duration += song.duration
-            duration = await self._format_duration(song_duration)
+        for playlist, song_duration in playlists:
+            duration = self._format_duration(song_duration)
             playlist_info.append(
                 f"{playlist.name} `{duration}` | " f"Created by <@{playlist.creator_id}>"
             )
@@ -1075,19 +1051,17 @@ class Musicbox(commands.Cog):
         # Get playlist from repo
         playlist = self.playlists.get_by_name_in_guild(playlist_name, interaction.guild)
         if not playlist:
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.FAIL.value,
-                description="That playlist does not exist.",
-            )
+            embed = self._create_playlist_not_found_embed(playlist_name)
             await interaction.response.send_message(embed=embed)
             return
 
         # Check if playlist limit has been reached
-        playlist_songs = self.playlist_songs.get_by_playlist(playlist.id)
-        if len(playlist_songs) > PLAYLIST_SONG_LIMIT:
+        last_song = self._get_last_song_in_playlist(playlist)
+        song_count = last_song.position + 1 if last_song else 0
+        if song_count >= PLAYLIST_SONG_LIMIT:
             embed = discord.Embed(
                 colour=constants.EmbedStatus.FAIL.value,
-                description="There's too many songs in the playlist. Remove"
+                description="There's too many songs in the playlist. Remove "
                 "some songs to be able to add more",
             )
             await interaction.response.send_message(embed=embed)
@@ -1100,42 +1074,45 @@ class Musicbox(commands.Cog):
         try:
             songs = await self._get_songs(url, interaction.user)
         except SongUnavailableError:
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.FAIL.value,
-                description="That song is unavailable. Maybe the link is invalid?",
-            )
-            await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embed=self.SONG_UNAVAILABLE_EMBED)
             return
 
-        # Update playlist last modified
-        playlist.modified_date = datetime.datetime.now(tz=datetime.UTC)
-        self.playlists.update(playlist)
-
-        # Add playlist
-        if songs[0].original_source in (
+        # Only playlists and albums add every found song, anything else adds the first
+        is_collection = songs[0].original_source in (
             OriginalSource.YOUTUBE_PLAYLIST,
             OriginalSource.SPOTIFY_PLAYLIST,
-        ):
-            self._add_collection_to_playlist(interaction.user, playlist, songs)
+            OriginalSource.YOUTUBE_ALBUM,
+            OriginalSource.SPOTIFY_ALBUM,
+        )
+        added_count = len(songs) if is_collection else 1
+
+        # Check the limit again with the songs being added, as the playlist may have changed
+        last_song = self._get_last_song_in_playlist(playlist)
+        song_count = last_song.position + 1 if last_song else 0
+        if song_count + added_count > PLAYLIST_SONG_LIMIT:
             embed = discord.Embed(
-                colour=constants.EmbedStatus.YES.value,
-                description=f"Added `{len(songs)}` songs from playlist "
-                f"[{songs[0].group}]({songs[0].group_url}) to "
-                f"#{len(playlist_songs) + 1} in playlist '{playlist_name}'",
+                colour=constants.EmbedStatus.FAIL.value,
+                description=f"Adding `{added_count}` songs would exceed the playlist limit of "
+                f"`{PLAYLIST_SONG_LIMIT}` songs. There's only room for "
+                f"`{max(PLAYLIST_SONG_LIMIT - song_count, 0)}` more.",
             )
             await interaction.followup.send(embed=embed)
+            return
 
-        # Add album
-        if songs[0].original_source in (
-            OriginalSource.YOUTUBE_ALBUM,
-            OriginalSource.SPOTIFY_ALBUM,
-        ):
+        # Add playlist or album
+        if is_collection:
             self._add_collection_to_playlist(interaction.user, playlist, songs)
+            group_type = (
+                "album"
+                if songs[0].original_source
+                in (OriginalSource.YOUTUBE_ALBUM, OriginalSource.SPOTIFY_ALBUM)
+                else "playlist"
+            )
             embed = discord.Embed(
                 colour=constants.EmbedStatus.YES.value,
-                description=f"Added `{len(songs)}` songs from album "
+                description=f"Added `{len(songs)}` songs from {group_type} "
                 f"[{songs[0].group}]({songs[0].group_url}) to "
-                f"#{len(playlist_songs) + 1} in playlist '{playlist_name}'",
+                f"#{song_count + 1} in playlist '{playlist_name}'",
             )
             await interaction.followup.send(embed=embed)
             return
@@ -1148,8 +1125,8 @@ class Musicbox(commands.Cog):
             embed=discord.Embed(
                 colour=constants.EmbedStatus.YES.value,
                 description=f"Added [{artist}{songs[0].title}]({songs[0].url}) "
-                f"`{await self._format_duration(songs[0].duration)}` "
-                f"to position #{len(playlist_songs) + 1} "
+                f"`{self._format_duration(songs[0].duration)}` "
+                f"to position #{song_count + 1} "
                 f"in playlist '{playlist_name}'",
             )
         )
@@ -1167,34 +1144,26 @@ class Musicbox(commands.Cog):
         # Get playlist from repo
         playlist = self.playlists.get_by_name_in_guild(playlist_name, interaction.guild)
         if not playlist:
+            embed = self._create_playlist_not_found_embed(playlist_name)
+            await interaction.response.send_message(embed=embed)
+            return
+
+        # Fetch selected song
+        selected_song = self.playlist_songs.get_by_position(playlist.id, index - 1)
+        if not selected_song:
             embed = discord.Embed(
                 colour=constants.EmbedStatus.FAIL.value,
-                description=f"Playlist `{playlist_name}` doesn't exist",
+                description=f"There is no song at position #{index} in `{playlist_name}`",
             )
             await interaction.response.send_message(embed=embed)
             return
 
-        # Fetch selected song and the song after
-        songs: list[PlaylistSong] = await self._order_playlist_songs(
-            self.playlist_songs.get_by_playlist(playlist.id)
-        )
-        selected_song = songs[int(index) - 1]
-
-        # Edit next song's previous song id if it exists
-        try:
-            next_song = songs[int(index)]
-            next_song.previous_id = selected_song.previous_id
-            self.playlist_songs.update(next_song)
-        except IndexError:
-            pass
-
-        # Update playlist last modified
+        # Remove selected song and update playlist last modified in one transaction
         playlist.modified_date = datetime.datetime.now(tz=datetime.UTC)
-        self.playlists.update(playlist)
-
-        # Remove selected song from playlist
-        self.playlist_songs.remove(selected_song.id)
-        duration = await self._format_duration(selected_song.duration)
+        with self.database:
+            self.playlist_songs.remove(selected_song.id, commit=False)
+            self.playlists.update(playlist, commit=False)
+        duration = self._format_duration(selected_song.duration)
         embed = discord.Embed(
             colour=constants.EmbedStatus.FAIL.value,
             description=f"[{selected_song.title}]({selected_song.url}) "
@@ -1219,55 +1188,33 @@ class Musicbox(commands.Cog):
         # Get playlist from repo
         playlist = self.playlists.get_by_name_in_guild(playlist_name, interaction.guild)
         if not playlist:
+            embed = self._create_playlist_not_found_embed(playlist_name)
+            await interaction.response.send_message(embed=embed)
+            return
+
+        # Fetch selected song
+        selected_song = self.playlist_songs.get_by_position(playlist.id, original_pos - 1)
+        if not selected_song:
             embed = discord.Embed(
                 colour=constants.EmbedStatus.FAIL.value,
-                description=f"Playlist `{playlist_name}` doesn't exist",
+                description=f"There is no song at position #{original_pos} in `{playlist_name}`",
             )
             await interaction.response.send_message(embed=embed)
             return
 
-        songs = await self._order_playlist_songs(self.playlist_songs.get_by_playlist(playlist.id))
-
-        if new_pos > len(songs):
-            new_pos = len(songs)
-        elif new_pos < 1:
-            new_pos = 1
-
-        selected_song = songs[original_pos - 1]
-        song_at_new_position = songs[new_pos - 1]
-
-        # If moving up, song after new position should be re-referenced to moved song
-        if new_pos > original_pos:
-            selected_song.previous_id = song_at_new_position.id
-            try:
-                song_after_new_position = songs[new_pos]
-                song_after_new_position.previous_id = selected_song.id
-                self.playlist_songs.update(song_after_new_position)
-            except IndexError:
-                pass
-
-        # If moving down, song at new position should be re-referenced to moved song
-        else:
-            selected_song.previous_id = song_at_new_position.previous_id
-            song_at_new_position.previous_id = selected_song.id
-            self.playlist_songs.update(song_at_new_position)
+        # Limit new position to the bounds of the playlist
+        last_song = self.playlist_songs.get_last_by_playlist(playlist.id)
+        song_count = last_song.position + 1 if last_song else 0
+        new_pos = max(1, min(new_pos, song_count))
 
-        # Fill in the gap at the original song position
-        try:
-            song_after_old_position = songs[original_pos]
-            song_before_old_position = songs[original_pos - 2]
-            song_after_old_position.previous_id = song_before_old_position.id
-            self.playlist_songs.update(song_after_old_position)
-        except IndexError:
-            pass
-
-        # Update playlist last modified
+        # Move song, shifting the songs in between, and update playlist last modified
         playlist.modified_date = datetime.datetime.now(tz=datetime.UTC)
-        self.playlists.update(playlist)
+        with self.database:
+            self.playlist_songs.move(selected_song, new_pos - 1, commit=False)
+            self.playlists.update(playlist, commit=False)
 
         # Output result to chat
-        self.playlist_songs.update(selected_song)
-        duration = await self._format_duration(selected_song.duration)
+        duration = self._format_duration(selected_song.duration)
         embed = discord.Embed(
             colour=constants.EmbedStatus.YES.value,
             description=f"[{selected_song.title}]({selected_song.url}) "
@@ -1287,15 +1234,14 @@ class Musicbox(commands.Cog):
             return
 
         # Fetch songs from playlist if it exists
-        playlist = self.playlists.get_by_name_in_guild(playlist_name, interaction.guild)
-        if not playlist:
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.FAIL.value,
-                description=f"Playlist `{playlist_name}` does not exist",
-            )
+        playlist_with_songs = self.playlists.get_by_name_in_guild_with_songs(
+            playlist_name, interaction.guild
+        )
+        if not playlist_with_songs:
+            embed = self._create_playlist_not_found_embed(playlist_name)
             await interaction.response.send_message(embed=embed)
             return
-        songs = await self._order_playlist_songs(self.playlist_songs.get_by_playlist(playlist.id))
+        playlist, songs = playlist_with_songs
 
         # Format the text of each song
         total_duration = 0
@@ -1307,7 +1253,7 @@ class Musicbox(commands.Cog):
                 if len(song.title) > MAX_DISPLAY_SONG_NAME_LENGTH
                 else song.title
             )
-            duration = await self._format_duration(song.duration)
+            duration = self._format_duration(song.duration)
             artist = f"{song.artist} - " if song.artist else ""
             formatted_songs.append(
                 f"[{artist}{song_name}]({song.url}) `{duration}` " f"| <@{song.requester_id}>"
@@ -1322,7 +1268,7 @@ class Musicbox(commands.Cog):
         embed.description += (
             playlist.description + "\n\u200b" if playlist.description else "\u200b"
         )
-        formatted_duration = await self._format_duration(total_duration)
+        formatted_duration = self._format_duration(total_duration)
         paginated_view = PaginatedView(
             embed,
             f"{len(songs)} Songs `{formatted_duration}`",
@@ -1348,16 +1294,14 @@ class Musicbox(commands.Cog):
             return
 
         # Fetch songs from playlist if it exists
-        playlist = self.playlists.get_by_name_in_guild(playlist_name, interaction.guild)
-        if not playlist:
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.FAIL.value,
-                description=f"Playlist `{playlist_name}` does not exist",
-            )
+        playlist_with_songs = self.playlists.get_by_name_in_guild_with_songs(
+            playlist_name, interaction.guild
+        )
+        if not playlist_with_songs:
+            embed = self._create_playlist_not_found_embed(playlist_name)
             await interaction.response.send_message(embed=embed)
             return
-
-        songs = await self._order_playlist_songs(self.playlist_songs.get_by_playlist(playlist.id))
+        playlist, songs = playlist_with_songs
         if not songs:
             embed = discord.Embed(
                 colour=constants.EmbedStatus.FAIL.value,
@@ -1366,25 +1310,48 @@ class Musicbox(commands.Cog):
             await interaction.response.send_message(embed=embed)
             return
 
-        stream = await self._get_song_from_saved(songs[0], playlist, interaction.user)
-        result = await music_player.add(stream[0])
-        if result == PlayerResult.PLAYING:
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.YES.value,
-                description=f"Now playing saved playlist '{playlist.name}'",
+        # Defer response as songs have to be searched for before they can be played
+        await interaction.response.defer()
+
+        # Play the first available song without waiting on the rest of the playlist
+        first_song = None
+        position = 0
+        while first_song is None and position < len(songs):
+            first_song = await self._get_song_from_saved(
+                songs[position], playlist, interaction.user
             )
-            await interaction.response.send_message(embed=embed)
-        else:
+            position += 1
+        if first_song is None:
             embed = discord.Embed(
-                colour=constants.EmbedStatus.YES.value,
-                description=f"Adding saved playlist '{playlist.name}' to queue",
+                colour=constants.EmbedStatus.FAIL.value,
+                description=f"None of the songs in playlist `{playlist.name}` are available",
             )
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed)
+            return
 
-        # Add remaining songs to queue
-        for i in range(1, len(songs)):
-            stream = await self._get_song_from_saved(songs[i], playlist, interaction.user)
-            await music_player.add(stream[0])
+        result = await music_player.add(first_song)
+        embed = discord.Embed(
+            colour=constants.EmbedStatus.YES.value,
+            description=f"Now playing saved playlist '{playlist.name}'"
+            if result == PlayerResult.PLAYING
+            else f"Adding saved playlist '{playlist.name}' to queue",
+        )
+        await interaction.followup.send(embed=embed)
+
+        # Add remaining songs to queue in playlist order
+        remaining_songs = songs[position:]
+        streams = await self._get_songs_from_saved(remaining_songs, playlist, interaction.user)
+        available_streams = [stream for stream in streams if stream is not None]
+        if available_streams:
+            await music_player.add_multiple(available_streams)
+
+        # Alert the user of any songs that couldn't be found
+        unavailable_songs = songs[: position - 1] + [
+            song for song, stream in zip(remaining_songs, streams, strict=True) if stream is None
+        ]
+        if unavailable_songs:
+            embed = self._create_unavailable_songs_embed(playlist, unavailable_songs)
+            await interaction.followup.send(embed=embed)
 
     @musicsettings_group.command(name="autodisconnect")
     @permissions.exclusive()
@@ -1405,7 +1372,7 @@ class Musicbox(commands.Cog):
             config["music"]["auto_disconnect"] = True
             result_text = "enabled"
 
-        self.bot.instance.save_config(config)
+        await self.bot.instance.save_config_async(config)
 
         embed = discord.Embed(
             colour=constants.EmbedStatus.YES.value,
@@ -1428,7 +1395,7 @@ class Musicbox(commands.Cog):
 
         # Set disconnect_time config variable
         config["music"]["disconnect_time"] = seconds
-        self.bot.instance.save_config(config)
+        await self.bot.instance.save_config_async(config)
 
         embed = discord.Embed(
             colour=constants.EmbedStatus.YES.value,
@@ -1448,11 +1415,16 @@ class Musicbox(commands.Cog):
             WavelinkMusicPlayer: The music player associated with the
             given voice channel.
         """
-        try:
-            music_player = self.music_players[channel.guild.id]
-        except KeyError:
-            music_player = await WavelinkMusicPlayer.connect(self.bot.instance, channel)
-            self.music_players[channel.guild.id] = music_player
+        music_player = self.music_players.get(channel.guild.id)
+        if music_player is not None:
+            return music_player
+
+        # Only connect once if multiple commands create a player in a guild at the same time
+        async with self.music_player_locks.setdefault(channel.guild.id, asyncio.Lock()):
+            music_player = self.music_players.get(channel.guild.id)
+            if music_player is None:
+                music_player = await WavelinkMusicPlayer.connect(self.bot.instance, channel)
+                self.music_players[channel.guild.id] = music_player
         return music_player
 
     async def _get_songs(self: Self, query: str, requester: discord.abc.User) -> tuple[Song, ...]:
@@ -1471,10 +1443,28 @@ class Musicbox(commands.Cog):
             return await WavelinkSong.from_query(query, requester)
         return await Song.from_query(query, requester)
 
+    async def _search_songs(
+        self: Self, query: str, requester: discord.abc.User, limit: int
+    ) -> tuple[Song, ...]:
+        """
+        Get the top songs from a search query.
+
+        Args:
+            query (str): The query used to search for songs.
+            requester (discord.User): The user requesting the songs.
+            limit (int): The maximum number of songs to get.
+
+        Returns:
+            tuple[Song, ...]: The songs found for the top results.
+        """
+        if self.player_type == "wavelink":
+            return await WavelinkSong.search(query, requester, limit)
+        return await Song.search(query, requester, limit)
+
     @staticmethod
     async def _get_song_from_saved(
         playlist_song: PlaylistSong, playlist: Playlist, requester: discord.abc.User
-    ) -> list[WavelinkSong]:
+    ) -> WavelinkSong | None:
         """
         Get a song from a saved playlist.
 
@@ -1484,10 +1474,93 @@ class Musicbox(commands.Cog):
             requester (discord.User): The user requesting the song.
 
         Returns:
-            WavelinkSong: The song object obtained from the
-            saved playlist.
+            WavelinkSong | None: The song object obtained from the
+            saved playlist, else None if the song is unavailable.
+        """
+        try:
+            songs = await WavelinkSong.from_local(requester, playlist_song, playlist)
+        except SongUnavailableError:
+            return None
+        return songs[0]
+
+    @classmethod
+    async def _get_songs_from_saved(
+        cls: type[Self],
+        playlist_songs: Sequence[PlaylistSong],
+        playlist: Playlist,
+        requester: discord.abc.User,
+    ) -> list[WavelinkSong | None]:
         """
-        return await WavelinkSong.from_local(requester, playlist_song, playlist)
+        Get multiple songs from a saved playlist.
+
+        Songs are searched for concurrently, with the amount of searches
+        running at once being limited so as to not flood the node.
+
+        Args:
+            playlist_songs (Sequence[PlaylistSong]): The playlist song
+                objects.
+            playlist (Playlist): The playlist object.
+            requester (discord.User): The user requesting the songs.
+
+        Returns:
+            list[WavelinkSong | None]: The song objects in the same
+            order as the playlist songs, with None in place of any
+            songs that are unavailable.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SONG_SEARCHES)
+
+        async def get_song(playlist_song: PlaylistSong) -> WavelinkSong | None:
+            async with semaphore:
+                return await cls._get_song_from_saved(playlist_song, playlist, requester)
+
+        return await asyncio.gather(*(get_song(song) for song in playlist_songs))
+
+    @staticmethod
+    def _create_playlist_not_found_embed(playlist_name: str) -> discord.Embed:
+        """
+        Create an embed alerting that a playlist does not exist.
+
+        Args:
+            playlist_name (str): The name of the playlist that was
+                requested.
+
+        Returns:
+            discord.Embed: The embed alerting the missing playlist.
+        """
+        return discord.Embed(
+            colour=constants.EmbedStatus.FAIL.value,
+            description=f"Playlist `{playlist_name}` doesn't exist",
+        )
+
+    @staticmethod
+    def _create_unavailable_songs_embed(
+        playlist: Playlist, unavailable_songs: Sequence[PlaylistSong]
+    ) -> discord.Embed:
+        """
+        Create an embed listing the playlist songs that were skipped.
+
+        Args:
+            playlist (Playlist): The playlist the songs belong to.
+            unavailable_songs (Sequence[PlaylistSong]): The songs that
+                could not be found.
+
+        Returns:
+            discord.Embed: The embed listing the unavailable songs.
+        """
+        song_format = "\n".join(
+            f"#{song.position + 1} {song.title}"
+            for song in unavailable_songs[:MAX_DISPLAY_UNAVAILABLE_SONGS]
+        )
+        if len(unavailable_songs) > MAX_DISPLAY_UNAVAILABLE_SONGS:
+            song_format += (
+                f"\n...and {len(unavailable_songs) - MAX_DISPLAY_UNAVAILABLE_SONGS} more"
+            )
+        return discord.Embed(
+            colour=constants.EmbedStatus.FAIL.value,
+            title="Unavailable Songs",
+            description=f"The following songs from playlist `{playlist.name}` could not be "
+            f"found and have been skipped:\n{song_format}",
+        )
 
     async def _find_music_player(
         self: Self, interaction: discord.Interaction
@@ -1550,11 +1623,7 @@ class Musicbox(commands.Cog):
         """
         # Alert if user is not running command in server
         if interaction.guild is None or not isinstance(interaction.user, discord.Member):
-            embed = discord.Embed(
-                colour=constants.EmbedStatus.FAIL.value,
-                description="You can't run this command in DMs.",
-            )
-            await interaction.response.send_message(embed=embed)
+            await interaction.response.send_message(embed=self.NOT_IN_SERVER_EMBED)
             return None, None
 
         # Alert if user is not in a voice channel
@@ -1593,80 +1662,50 @@ class Musicbox(commands.Cog):
 
         return interaction.guild.voice_client.channel
 
-    @staticmethod
-    async def _format_duration(milliseconds: int) -> str:
+    @classmethod
+    def _format_queue_song(cls: type[Self], song: Song) -> str:
         """
-        Format the duration in milliseconds to a human readable format.
+        Format a queued song as a linked line for queue listings.
 
         Args:
-            milliseconds (int): The duration in milliseconds.
+            song (Song): The song to format.
 
         Returns:
-            str: The formatted duration in the format HH:MM:SS.
+            str: The artist, title, link and duration of the song.
         """
-        # Convert milliseconds to seconds
-        seconds = milliseconds // 1000
-
-        hours, remainder = divmod(seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-
-        formatted = ""
-        overflow_value = 10
-        if hours:
-            if hours < overflow_value:
-                formatted += f"0{hours!s}:"
-            else:
-                formatted += f"{hours!s}:"
-
-        if minutes:
-            if minutes < overflow_value:
-                formatted += f"0{minutes}:"
-            else:
-                formatted += f"{minutes}:"
-        elif hours:
-            formatted += "00:"
-        else:
-            formatted += "0:"
-
-        if seconds:
-            if seconds < overflow_value:
-                formatted += f"0{seconds}"
-            else:
-                formatted += f"{seconds}"
-        else:
-            formatted += "00"
-
-        return formatted
+        artist = f"{song.artist} - " if song.artist else ""
+        return f"[{artist}{song.title}]({song.url}) `{cls._format_duration(song.duration)}`"
 
     @staticmethod
-    async def _order_playlist_songs(
-        playlist_songs: list[PlaylistSong],
-    ) -> list[PlaylistSong]:
+    @functools.lru_cache(maxsize=4096)
+    def _format_duration(milliseconds: float | None) -> str:
         """
-        Orders a list of playlist songs based on their song ID ordering.
+        Format the duration in milliseconds to a human readable format.
+
+        Results are cached as the same durations are commonly formatted
+        repeatedly when viewing queues and playlists.
 
         Args:
-            playlist_songs (List[PlaylistSong]): A list of playlist
-            songs.
+            milliseconds (float | None): The duration in milliseconds.
 
         Returns:
-            List[PlaylistSong]: A list of playlist songs ordered based
-            on their previous song IDs.
-
+            str: The formatted duration in the format HH:MM:SS, or N/A
+                if the duration is missing or negative.
         """
-        # Use dictionary to pair songs with the next song
-        song_links = {}
-        for song in playlist_songs:
-            song_links[song.previous_id] = song
+        if milliseconds is None or milliseconds < 0:
+            return "N/A"
 
-        # Order playlist songs into list
-        ordered_songs = []
-        next_song = song_links.get(uuid.UUID(int=0))
-        while next_song is not None:
-            ordered_songs.append(next_song)
-            next_song = song_links.get(next_song.id)
+        # Convert milliseconds to whole seconds
+        seconds = int(milliseconds) // 1000
+
+        hours, remainder = divmod(seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
 
-        return ordered_songs
+        if hours:
+            return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        if minutes:
+            return f"{minutes:02d}:{seconds:02d}"
+        return f"0:{seconds:02d}"
 
     @staticmethod
     def _parse_time(time_string: str) -> int:
@@ -1689,7 +1728,7 @@ class Musicbox(commands.Cog):
         self: Self, user: discord.abc.User, playlist: Playlist, song: Song
     ) -> None:
         """
-        Add a song to a playlist.
+        Add a song to a playlist and update its last modified date.
 
         Args:
             user (discord.abc.User): The user who added the song.
@@ -1697,7 +1736,7 @@ class Musicbox(commands.Cog):
             song (Song): The song to add to the playlist.
         """
         last_song = self._get_last_song_in_playlist(playlist)
-        previous_id = last_song.id if last_song else uuid.UUID(int=0)
+        position = last_song.position + 1 if last_song else 0
         new_playlist_song = PlaylistSong.create_new(
             playlist.id,
             user.id,
@@ -1705,15 +1744,18 @@ class Musicbox(commands.Cog):
             song.artist,
             song.duration,
             song.url,
-            previous_id,
+            position,
         )
-        self.playlist_songs.add(new_playlist_song)
+        playlist.modified_date = datetime.datetime.now(tz=datetime.UTC)
+        with self.database:
+            self.playlist_songs.add(new_playlist_song, commit=False)
+            self.playlists.update(playlist, commit=False)
 
     def _add_collection_to_playlist(
         self: Self, user: discord.abc.User, playlist: Playlist, songs: Sequence[Song]
     ) -> None:
         """
-        Add a list of playlist songs to a playlist.
+        Add a list of songs to a playlist and update its modified date.
 
         Args:
             user (discord.abc.User): The user who added the songs.
@@ -1721,19 +1763,23 @@ class Musicbox(commands.Cog):
             songs (List[Song]): The songs to add to the playlist.
         """
         last_song = self._get_last_song_in_playlist(playlist)
-        previous_id = last_song.id if last_song else uuid.UUID(int=0)
-        for song in songs:
-            new_playlist_song = PlaylistSong.create_new(
+        start_position = last_song.position + 1 if last_song else 0
+        new_playlist_songs = [
+            PlaylistSong.create_new(
                 playlist.id,
                 user.id,
                 song.title,
                 song.artist,
                 song.duration,
                 song.url,
-                previous_id,
+                position,
             )
-            self.playlist_songs.add(new_playlist_song)
-            previous_id = new_playlist_song.id
+            for position, song in enumerate(songs, start_position)
+        ]
+        playlist.modified_date = datetime.datetime.now(tz=datetime.UTC)
+        with self.database:
+            self.playlist_songs.add_multiple(new_playlist_songs, commit=False)
+            self.playlists.update(playlist, commit=False)
 
     def _get_last_song_in_playlist(self: Self, playlist: Playlist) -> PlaylistSong | None:
         """
@@ -1746,17 +1792,7 @@ class Musicbox(commands.Cog):
             PlaylistSong | None: The last song in the playlist, else None
                 if the playlist is empty.
         """
-        playlist_songs = self.playlist_songs.get_by_playlist(playlist.id)
-        if not playlist_songs:
-            previous_id = uuid.UUID(int=0)
-        else:
-            song_ids = []
-            previous_ids = []
-            for playlist_song in playlist_songs:
-                song_ids.append(playlist_song.id)
-                previous_ids.append(playlist_song.previous_id)
-            previous_id = next(iter(set(song_ids) - set(previous_ids)))
-        return self.playlist_songs.get_by_id(previous_id)
+        return self.playlist_songs.get_last_by_playlist(playlist.id)
 
 
 async def setup(bot: SpaceCat) -> None:
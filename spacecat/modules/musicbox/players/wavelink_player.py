@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import random
 from collections import deque
+from itertools import islice
 from time import time
 from typing import TYPE_CHECKING, Self, override
 
@@ -35,6 +36,18 @@ VocalGuildChannel = discord.VoiceChannel | discord.StageChannel
 class WavelinkSong(Song):
     """Represents a song using data from wavelink."""
 
+    __slots__ = (
+        "_track",
+        "_original_source",
+        "_url",
+        "_playlist",
+        "_playlist_url",
+        "_title",
+        "_artist",
+        "_duration",
+        "_requester_id",
+    )
+
     def __init__(
         self: WavelinkSong,
         track: wavelink.Playable,
@@ -137,8 +150,14 @@ class WavelinkSong(Song):
         Returns:
             list['WavelinkSong']: A list containing WavelinkSong objects
                 created from the local playlist song.
+
+        Raises:
+            SongUnavailableError: If the song could not be found.
         """
         track = await wavelink.Playable.search(playlist_song.url)
+        if not track:
+            raise SongUnavailableError
+
         return [
             cls(
                 track[0],
@@ -177,6 +196,48 @@ class WavelinkSong(Song):
             return await cls._process_single(query, tracks[0], requester)
         return await cls._process_multiple(query, tracks, requester)
 
+    @override
+    @classmethod
+    async def search(
+        cls: type[Self], query: str, requester: discord.abc.User, limit: int
+    ) -> tuple[Self, ...]:
+        """
+        Creates wavelink song objects from the top search results.
+
+        Only the requested amount of results are converted, rather than
+        every track returned by the search.
+
+        Parameters:
+            query (str): The query used to search for tracks.
+            requester (discord.abc.User): The user requesting the tracks.
+            limit (int): The maximum number of results to create.
+
+        Returns:
+            tuple['WavelinkSong', ...]: WavelinkSong objects created from
+                the top search results.
+
+        Raises:
+            SongUnavailableError: If the search returned no results.
+        """
+        tracks = await wavelink.Playable.search(query)
+        if not tracks:
+            raise SongUnavailableError
+
+        return tuple(
+            cls(
+                track,
+                OriginalSource.UNKNOWN,
+                track.uri if track.uri is not None else "",
+                "",
+                "",
+                track.title,
+                track.author,
+                track.length,
+                requester.id,
+            )
+            for track in islice(tracks, limit)
+        )
+
     @classmethod
     async def _process_single(
         cls: type[Self], query: str, track: wavelink.Playable, requester: discord.abc.User
@@ -197,6 +258,7 @@ class WavelinkSong(Song):
             list['WavelinkSong']: A list containing a single
                 WavelinkSong object created from the query.
         """
+        source = OriginalSource.UNKNOWN
         if "youtube.com" in query or "youtu.be" in query:
             if "music" in query:
                 source = OriginalSource.YOUTUBE_SONG
@@ -204,8 +266,6 @@ class WavelinkSong(Song):
                 source = OriginalSource.YOUTUBE_VIDEO
         elif "open.spotify.com" in query:
             source = OriginalSource.SPOTIFY_SONG
-        else:
-            source = OriginalSource.UNKNOWN
 
         return (
             cls(
@@ -250,30 +310,25 @@ class WavelinkSong(Song):
         url = query
         playlist_name = ""
 
-        if tracks[0].playlist:
+        playlist = tracks[0].playlist
+        if playlist:
             if "youtube.com" in query or "youtu.be" in query:
-                if tracks[0].playlist is not None and "Album - " in tracks[0].playlist.name:
-                    source, playlist_name = (
-                        OriginalSource.YOUTUBE_ALBUM,
-                        tracks[0].playlist.name[8:],
-                    )
-                elif tracks[0].playlist is not None and "playlist" in query:
-                    source, playlist_name = (
-                        OriginalSource.YOUTUBE_PLAYLIST,
-                        tracks[0].playlist.name,
-                    )
+                if "Album - " in playlist.name:
+                    source, playlist_name = OriginalSource.YOUTUBE_ALBUM, playlist.name[8:]
+                elif "playlist" in query:
+                    source, playlist_name = OriginalSource.YOUTUBE_PLAYLIST, playlist.name
             elif "open.spotify.com" in query:
                 if "playlist" in query:
                     source, url, playlist_name = (
                         OriginalSource.SPOTIFY_PLAYLIST,
-                        tracks[0].playlist.url,
-                        tracks[0].playlist.name,
+                        playlist.url,
+                        playlist.name,
                     )
                 elif "album" in query:
                     source, url, playlist_name = (
                         OriginalSource.SPOTIFY_ALBUM,
-                        tracks[0].playlist.url,
-                        tracks[0].playlist.name,
+                        playlist.url,
+                        playlist.name,
                     )
 
         wavelink_tracks = [
@@ -392,8 +447,7 @@ class WavelinkMusicPlayer(MusicPlayer[WavelinkSong]):
     async def play_multiple(self: Self, songs: list[WavelinkSong]) -> None:
         self._refresh_disconnect_timer()
         await self._player.play(songs[0].stream)
-        for song in songs[1:]:
-            self._next_queue.appendleft(song)
+        self._next_queue.extendleft(reversed(songs[1:]))
 
     @override
     async def add(self: Self, audio_source: WavelinkSong, index: int = -1) -> PlayerResult:
@@ -418,18 +472,18 @@ class WavelinkMusicPlayer(MusicPlayer[WavelinkSong]):
             self._refresh_disconnect_timer()
             await self._player.play(audio_sources[0].stream)
             self._current = audio_sources[0]
-            for audio_source in audio_sources[1:]:
-                self._next_queue.append(audio_source)
+            self._next_queue.extend(audio_sources[1:])
             return PlayerResult.PLAYING
 
-        if index >= 0:
-            insert_index = index
-            for audio_source in audio_sources:
-                self._next_queue.insert(insert_index, audio_source)
-                insert_index += 1
+        # Rotate the insert position to the front to add the songs as one block,
+        # appending instead when the position is at or past the end of the queue
+        if 0 <= index < len(self._next_queue):
+            self._next_queue.rotate(-index)
+            self._next_queue.extendleft(reversed(audio_sources))
+            self._next_queue.rotate(index)
+            return PlayerResult.QUEUEING
 
-        for audio_source in audio_sources:
-            self._next_queue.append(audio_source)
+        self._next_queue.extend(audio_sources)
         return PlayerResult.QUEUEING
 
     @override
@@ -544,10 +598,11 @@ class WavelinkMusicPlayer(MusicPlayer[WavelinkSong]):
 
     @tasks.loop(seconds=30)
     async def _disconnect_job(self: Self) -> None:
+        # Check local player state first to avoid reading config while active
         if (
-            self._is_auto_disconnect()
-            and time() > self._disconnect_time
+            time() > self._disconnect_time
             and not self._player.playing
+            and self._is_auto_disconnect()
         ):
             await self.disconnect()
 
@@ -555,9 +610,7 @@ class WavelinkMusicPlayer(MusicPlayer[WavelinkSong]):
         self._disconnect_time = time() + self._get_disconnect_time_limit()
 
     def _get_disconnect_time_limit(self: Self) -> int:
-        config = self._instance.get_config()
-        return config["music"]["disconnect_time"]
+        return self._instance.get_config_value("music", "disconnect_time")
 
     def _is_auto_disconnect(self: Self) -> bool:
-        config = self._instance.get_config()
-        return config["music"]["auto_disconnect"]
+        return self._instance.get_config_value("music", "auto_disconnect")
@@ -201,6 +201,9 @@ class PlaylistRepository:
             "(id TEXT PRIMARY KEY, name TEXT, guild_id INTEGER, creator_id INTEGER, "
             "creation_date INTEGER, modified_date INTEGER, description TEXT)"
         )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS playlist_guild_id_name ON playlist (guild_id, name)"
+        )
         self.db.commit()
 
     def get_all(self: Self) -> list[Playlist | None]:
@@ -244,6 +247,37 @@ class PlaylistRepository:
             if playlist is not None
         ]
 
+    def get_by_guild_with_duration(self: Self, guild: discord.Guild) -> list[tuple[Playlist, int]]:
+        """
+        Get list of all playlists in a guild with their total duration.
+
+        The duration of each playlist is aggregated by the database in
+        the same query, saving the need to fetch every song of every
+        playlist in order to sum them up.
+
+        Args:
+            guild: The guild associated with the playlists.
+
+        Returns:
+            list[tuple[Playlist, int]]: List of playlists in the guild,
+                each paired with the sum of its song durations.
+        """
+        cursor = self.db.cursor()
+        values = (guild.id,)
+        cursor.execute(
+            "SELECT playlist.*, COALESCE(SUM(playlist_songs.duration), 0) FROM playlist "
+            "LEFT JOIN playlist_songs ON playlist_songs.playlist_id = playlist.id "
+            "WHERE playlist.guild_id=? GROUP BY playlist.id ORDER BY playlist.rowid",
+            values,
+        )
+        results = cursor.fetchall()
+
+        return [
+            (playlist, result[7])
+            for result in results
+            if (playlist := self._result_to_playlist(result)) is not None
+        ]
+
     def get_by_name_in_guild(self: Self, name: str, guild: discord.Guild) -> Playlist | None:
         """
         Get a playlist by its name and guild.
@@ -265,6 +299,50 @@ class PlaylistRepository:
         ).fetchone()
         return self._result_to_playlist(result)
 
+    def get_by_name_in_guild_with_songs(
+        self: Self, name: str, guild: discord.Guild
+    ) -> tuple[Playlist, list[PlaylistSong]] | None:
+        """
+        Get a playlist by its name and guild along with its songs.
+
+        The playlist and its songs are joined by the database in a
+        single query, rather than looking up the playlist before
+        separately fetching its songs.
+
+        Args:
+            name (str): The name of the playlist.
+            guild (discord.Guild): The guild associated with the
+                playlist.
+
+        Returns:
+            tuple[Playlist, list[PlaylistSong]] | None: The playlist
+                paired with its songs ordered by position, or None if
+                the playlist does not exist.
+        """
+        cursor = self.db.cursor()
+        values = (guild.id, name)
+        cursor.execute(
+            "SELECT playlist.*, playlist_songs.* FROM playlist "
+            "LEFT JOIN playlist_songs ON playlist_songs.playlist_id = playlist.id "
+            "WHERE playlist.guild_id=? AND playlist.name=? "
+            "ORDER BY playlist.rowid, playlist_songs.position",
+            values,
+        )
+        results = cursor.fetchall()
+
+        playlist = self._result_to_playlist(results[0][:7]) if results else None
+        if playlist is None:
+            return None
+
+        # Only keep songs belonging to the first matching playlist
+        songs = [
+            song
+            for result in results
+            if result[8] == str(playlist.id)
+            and (song := PlaylistSong.from_row(result[7:])) is not None
+        ]
+        return playlist, songs
+
     def add(self: Self, playlist: Playlist) -> None:
         """
         Add a new playlist to the database.
@@ -285,12 +363,14 @@ class PlaylistRepository:
         cursor.execute("INSERT INTO playlist VALUES (?, ?, ?, ?, ?, ?, ?)", values)
         self.db.commit()
 
-    def update(self: Self, playlist: Playlist) -> None:
+    def update(self: Self, playlist: Playlist, *, commit: bool = True) -> None:
         """
         Update a playlist in the database.
 
         Args:
             playlist (Playlist): The playlist object to be updated.
+            commit (bool): Whether to commit straight away. Pass False
+                to group the change into a larger transaction.
         """
         cursor = self.db.cursor()
         values = (
@@ -300,25 +380,29 @@ class PlaylistRepository:
             int(playlist.creation_date.timestamp()),
             int(playlist.modified_date.timestamp()),
             playlist.description,
-            playlist.id,
+            str(playlist.id),
         )
         cursor.execute(
             "UPDATE playlist SET name=?, guild_id=?, creator_id=?, creation_date=?, "
             "modified_date=?, description=? WHERE id=?",
             values,
         )
-        self.db.commit()
+        if commit:
+            self.db.commit()
 
-    def remove(self: Self, id_: uuid.UUID) -> None:
+    def remove(self: Self, id_: uuid.UUID, *, commit: bool = True) -> None:
         """
         Remove a playlist from the database by its ID.
 
         Args:
             id_ (uuid.UUID): The ID of the playlist to be removed.
+            commit (bool): Whether to commit straight away. Pass False
+                to group the change into a larger transaction.
         """
         cursor = self.db.cursor()
         cursor.execute("DELETE FROM playlist WHERE id=?", (str(id_),))
-        self.db.commit()
+        if commit:
+            self.db.commit()
 
     @staticmethod
     def _result_to_playlist(result: tuple) -> Playlist | None:
@@ -350,6 +434,17 @@ class PlaylistRepository:
 class PlaylistSong:
     """A song in a playlist."""
 
+    __slots__ = (
+        "_id",
+        "_playlist_id",
+        "_requester_id",
+        "_title",
+        "_artist",
+        "_url",
+        "_duration",
+        "_position",
+    )
+
     def __init__(
         self: PlaylistSong,
         id_: uuid.UUID,
@@ -359,7 +454,7 @@ class PlaylistSong:
         artist: str,
         duration: int,
         url: str,
-        previous_id: uuid.UUID,
+        position: int,
     ) -> None:
         """
         Initialise a new instance of the PlaylistSong class.
@@ -377,8 +472,8 @@ class PlaylistSong:
             artist (str): The artist of the song.
             duration (int): The duration of the song in seconds.
             url (str): The URL of the song.
-            previous_id (uuid.UUID): The unique identifier of the
-                previous song in the playlist.
+            position (int): The zero based position of the song in
+                the playlist.
         """
         self._id: uuid.UUID = id_
         self._playlist_id = playlist_id
@@ -387,7 +482,7 @@ class PlaylistSong:
         self._artist = artist
         self._url = url
         self._duration = duration
-        self._previous_id = previous_id
+        self._position = position
 
     @classmethod
     def create_new(
@@ -398,7 +493,7 @@ class PlaylistSong:
         artist: str,
         duration: int,
         url: str,
-        previous_id: uuid.UUID,
+        position: int,
     ) -> Self:
         """
         A function to create a new instance of the PlaylistSong class.
@@ -413,14 +508,41 @@ class PlaylistSong:
             artist (str): The artist of the song.
             duration (int): The duration of the song in seconds.
             url (str): The URL of the song.
-            previous_id (uuid.UUID): The unique identifier of the
-                previous song in the playlist.
+            position (int): The zero based position of the song in
+                the playlist.
 
         Returns:
             Self: A new instance of the PlaylistSong class.
         """
-        return cls(
-            uuid.uuid4(), playlist_id, requester_id, title, artist, duration, url, previous_id
+        return cls(uuid.uuid4(), playlist_id, requester_id, title, artist, duration, url, position)
+
+    @classmethod
+    def from_row(cls: type[Self], row: tuple) -> Self | None:
+        """
+        Create a PlaylistSong from a playlist_songs database row.
+
+        Args:
+            cls (type[Self]): The class type.
+            row (tuple): The row returned by the database query, in
+                playlist_songs column order.
+
+        Returns:
+            Self | None: The PlaylistSong created from the row, or None
+                if the row is empty.
+        """
+        return (
+            cls(
+                uuid.UUID(row[0]),
+                uuid.UUID(row[1]),
+                row[2],
+                row[3],
+                row[4],
+                row[5],
+                row[6],
+                row[7],
+            )
+            if row
+            else None
         )
 
     @property
@@ -495,24 +617,24 @@ class PlaylistSong:
         return self._url
 
     @property
-    def previous_id(self: Self) -> uuid.UUID:
+    def position(self: Self) -> int:
         """
-        Get the unique identifier of the previous song in the playlist.
+        Get the zero based position of the song in the playlist.
 
         Returns:
-            uuid.UUID: The unique identifier of the previous song.
+            int: The position of the song.
         """
-        return self._previous_id
+        return self._position
 
-    @previous_id.setter
-    def previous_id(self: Self, value: uuid.UUID) -> uuid.UUID | None:
+    @position.setter
+    def position(self: Self, value: int) -> None:
         """
-        Set the value of the previous_id attribute.
+        Set the value of the position attribute.
 
         Args:
-            value (uuid.UUID): The new value for the previous_id attribute.
+            value (int): The new value for the position attribute.
         """
-        self._previous_id = value
+        self._position = value
 
 
 class PlaylistSongRepository:
@@ -528,10 +650,15 @@ class PlaylistSongRepository:
         self.db = database
         cursor = self.db.cursor()
         cursor.execute("PRAGMA foreign_keys = ON")
+        self._migrate_previous_id_to_position()
         cursor.execute(
             "CREATE TABLE IF NOT EXISTS playlist_songs (id TEXT PRIMARY KEY, playlist_id TEXT, "
             "requester_id INTEGER, title TEXT, artist TEXT, duration INTEGER, url TEXT, "
-            "previous_id INTEGER, FOREIGN KEY(playlist_id) REFERENCES playlist(id))"
+            "position INTEGER, FOREIGN KEY(playlist_id) REFERENCES playlist(id))"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS playlist_songs_playlist_id_position "
+            "ON playlist_songs (playlist_id, position)"
         )
         self.db.commit()
 
@@ -546,13 +673,15 @@ class PlaylistSongRepository:
             Any: The playlist song object retrieved by the ID.
         """
         result = (
-            self.db.cursor().execute("SELECT * FROM playlist_songs WHERE id=?", (id_,)).fetchone()
+            self.db.cursor()
+            .execute("SELECT * FROM playlist_songs WHERE id=?", (str(id_),))
+            .fetchone()
         )
-        return self._result_to_playlist_song(result)
+        return PlaylistSong.from_row(result)
 
     def get_by_playlist(self: Self, playlist_id: uuid.UUID) -> list[PlaylistSong]:
         """
-        Get a list of all songs in a playlist.
+        Get a list of all songs in a playlist, ordered by position.
 
         Args:
             playlist_id (uuid.UUID): The ID of the playlist.
@@ -564,20 +693,68 @@ class PlaylistSongRepository:
         """
         # Get list of all songs in playlist
         cursor = self.db.cursor()
-        cursor.execute("SELECT * FROM playlist_songs WHERE playlist_id=?", (str(playlist_id),))
+        cursor.execute(
+            "SELECT * FROM playlist_songs WHERE playlist_id=? ORDER BY position",
+            (str(playlist_id),),
+        )
         results = cursor.fetchall()
         return [
             song
-            for song in [self._result_to_playlist_song(result) for result in results]
+            for song in [PlaylistSong.from_row(result) for result in results]
             if song is not None
         ]
 
-    def add(self: Self, playlist_song: PlaylistSong) -> None:
+    def get_by_position(self: Self, playlist_id: uuid.UUID, position: int) -> PlaylistSong | None:
+        """
+        Get the song at a specific position in a playlist.
+
+        Args:
+            playlist_id (uuid.UUID): The ID of the playlist.
+            position (int): The zero-based position of the song.
+
+        Returns:
+            PlaylistSong | None: The song at the position, or None if
+                there is no song there.
+        """
+        result = (
+            self.db.cursor()
+            .execute(
+                "SELECT * FROM playlist_songs WHERE playlist_id=? AND position=?",
+                (str(playlist_id), position),
+            )
+            .fetchone()
+        )
+        return PlaylistSong.from_row(result)
+
+    def get_last_by_playlist(self: Self, playlist_id: uuid.UUID) -> PlaylistSong | None:
+        """
+        Get the song in the last position of a playlist.
+
+        Args:
+            playlist_id (uuid.UUID): The ID of the playlist.
+
+        Returns:
+            PlaylistSong | None: The last song in the playlist, or None
+                if the playlist is empty.
+        """
+        result = (
+            self.db.cursor()
+            .execute(
+                "SELECT * FROM playlist_songs WHERE playlist_id=? ORDER BY position DESC LIMIT 1",
+                (str(playlist_id),),
+            )
+            .fetchone()
+        )
+        return PlaylistSong.from_row(result)
+
+    def add(self: Self, playlist_song: PlaylistSong, *, commit: bool = True) -> None:
         """
         Add a playlist song to the database.
 
         Args:
             playlist_song (PlaylistSong): The playlist song object to be added.
+            commit (bool): Whether to commit straight away. Pass False
+                to group the change into a larger transaction.
         """
         cursor = self.db.cursor()
         values = (
@@ -588,10 +765,41 @@ class PlaylistSongRepository:
             playlist_song.artist,
             playlist_song.duration,
             playlist_song.url,
-            str(playlist_song.previous_id),
+            playlist_song.position,
         )
         cursor.execute("INSERT INTO playlist_songs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", values)
-        self.db.commit()
+        if commit:
+            self.db.commit()
+
+    def add_multiple(
+        self: Self, playlist_songs: list[PlaylistSong], *, commit: bool = True
+    ) -> None:
+        """
+        Add multiple playlist songs to the database in one transaction.
+
+        Args:
+            playlist_songs (list[PlaylistSong]): The playlist song
+                objects to be added.
+            commit (bool): Whether to commit straight away. Pass False
+                to group the change into a larger transaction.
+        """
+        cursor = self.db.cursor()
+        values = [
+            (
+                str(playlist_song.id),
+                str(playlist_song.playlist_id),
+                playlist_song.requester_id,
+                playlist_song.title,
+                playlist_song.artist,
+                playlist_song.duration,
+                playlist_song.url,
+                playlist_song.position,
+            )
+            for playlist_song in playlist_songs
+        ]
+        cursor.executemany("INSERT INTO playlist_songs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", values)
+        if commit:
+            self.db.commit()
 
     def update(self: Self, playlist_song: PlaylistSong) -> None:
         """
@@ -609,50 +817,142 @@ class PlaylistSongRepository:
             playlist_song.artist,
             playlist_song.duration,
             playlist_song.url,
-            str(playlist_song.previous_id),
+            playlist_song.position,
             str(playlist_song.id),
         )
         cursor.execute(
             "UPDATE playlist_songs SET playlist_id=?, requester_id=?, title=?, "
-            "artist=?, duration=?, url=?, previous_id=? WHERE id=?",
+            "artist=?, duration=?, url=?, position=? WHERE id=?",
             values,
         )
         self.db.commit()
 
-    def remove(self: Self, id_: uuid.UUID) -> None:
+    def move(
+        self: Self, playlist_song: PlaylistSong, new_position: int, *, commit: bool = True
+    ) -> None:
+        """
+        Move a playlist song to a new position in its playlist.
+
+        Songs between the old and new position are shifted by one to
+        fill in the gap left behind by the moved song.
+
+        Args:
+            playlist_song (PlaylistSong): The playlist song to move.
+            new_position (int): The zero based position to move the
+                song to.
+            commit (bool): Whether to commit straight away. Pass False
+                to group the change into a larger transaction.
+        """
+        # Shift every song in the affected range and place the moved song in one statement
+        old_position = playlist_song.position
+        shift = -1 if new_position > old_position else 1
+        values = (
+            str(playlist_song.id),
+            new_position,
+            shift,
+            str(playlist_song.playlist_id),
+            min(old_position, new_position),
+            max(old_position, new_position),
+        )
+        cursor = self.db.cursor()
+        cursor.execute(
+            "UPDATE playlist_songs SET position=CASE WHEN id=? THEN ? ELSE position+? END "
+            "WHERE playlist_id=? AND position BETWEEN ? AND ?",
+            values,
+        )
+        if commit:
+            self.db.commit()
+        playlist_song.position = new_position
+
+    def remove(self: Self, id_: uuid.UUID, *, commit: bool = True) -> None:
         """
         Removes a playlist song from the database by its ID.
 
+        Songs positioned after the removed song are shifted back by one
+        to close the gap.
+
         Parameters:
             id_ (uuid.UUID): The ID of the playlist song to be removed.
+            commit (bool): Whether to commit straight away. Pass False
+                to group the change into a larger transaction.
         """
         cursor = self.db.cursor()
+        result = cursor.execute(
+            "SELECT playlist_id, position FROM playlist_songs WHERE id=?", (str(id_),)
+        ).fetchone()
         cursor.execute("DELETE FROM playlist_songs WHERE id=?", (str(id_),))
-        self.db.commit()
+        if result:
+            cursor.execute(
+                "UPDATE playlist_songs SET position=position-1 WHERE playlist_id=? AND position>?",
+                result,
+            )
+        if commit:
+            self.db.commit()
 
-    @staticmethod
-    def _result_to_playlist_song(result: tuple) -> PlaylistSong | None:
+    def remove_by_playlist(self: Self, playlist_id: uuid.UUID, *, commit: bool = True) -> None:
         """
-        Convert a database result tuple to a PlaylistSong object.
+        Removes all songs belonging to a playlist from the database.
 
-        Args:
-            result (tuple): The resulting tuple from the database query.
+        Parameters:
+            playlist_id (uuid.UUID): The ID of the playlist to remove
+                the songs of.
+            commit (bool): Whether to commit straight away. Pass False
+                to group the change into a larger transaction.
+        """
+        cursor = self.db.cursor()
+        cursor.execute("DELETE FROM playlist_songs WHERE playlist_id=?", (str(playlist_id),))
+        if commit:
+            self.db.commit()
 
-        Returns:
-            PlaylistSong | None: The converted PlaylistSong object, or
-                None if the result is empty.
+    def _migrate_previous_id_to_position(self: Self) -> None:
         """
-        return (
-            PlaylistSong(
-                uuid.UUID(result[0]),
-                uuid.UUID(result[1]),
-                result[2],
-                result[3],
-                result[4],
-                result[5],
-                result[6],
-                uuid.UUID(result[7]),
+        Migrate song ordering from a linked list to a position column.
+
+        Older versions stored the ID of the previous song on each row,
+        requiring the whole playlist to be walked in order to sort it.
+        The table is rebuilt with each song assigned the position it
+        was found at when walking the existing links. Songs with broken
+        or duplicate links are appended to the end so that they aren't
+        lost. The rebuild is done in a single transaction so that an
+        interrupted migration leaves the original table untouched.
+        """
+        cursor = self.db.cursor()
+        columns = [row[1] for row in cursor.execute("PRAGMA table_info(playlist_songs)")]
+        if "previous_id" not in columns:
+            return
+
+        # Group the songs of each playlist by ID and by the song that precedes them
+        playlist_songs: dict[str, dict[str, tuple]] = {}
+        next_songs: dict[str, dict[str, list[tuple]]] = {}
+        for row in cursor.execute("SELECT * FROM playlist_songs").fetchall():
+            playlist_songs.setdefault(row[1], {})[row[0]] = row
+            next_songs.setdefault(row[1], {}).setdefault(row[7], []).append(row)
+
+        # Walk each playlist from the start to determine song positions
+        rows = []
+        for playlist_id, songs in playlist_songs.items():
+            links = next_songs[playlist_id]
+            ordered = []
+            candidates = links.get(str(uuid.UUID(int=0)), [])
+            while candidates and candidates[0][0] in songs:
+                next_song = songs.pop(candidates[0][0])
+                ordered.append(next_song)
+                candidates = links.get(next_song[0], [])
+            ordered.extend(songs.values())
+            rows.extend((*row[:7], position) for position, row in enumerate(ordered))
+
+        # Rebuild the table with positions in place of previous IDs
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute("ALTER TABLE playlist_songs RENAME TO playlist_songs_old")
+            cursor.execute(
+                "CREATE TABLE playlist_songs (id TEXT PRIMARY KEY, playlist_id TEXT, "
+                "requester_id INTEGER, title TEXT, artist TEXT, duration INTEGER, url TEXT, "
+                "position INTEGER, FOREIGN KEY(playlist_id) REFERENCES playlist(id))"
             )
-            if result
-            else None
-        )
+            cursor.executemany("INSERT INTO playlist_songs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            cursor.execute("DROP TABLE playlist_songs_old")
+        except BaseException:
+            self.db.rollback()
+            raise
+        self.db.commit()
@@ -19,6 +19,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Self
 
 import discord
+import toml
 from discord import app_commands
 from discord.ext import commands
 
@@ -60,7 +61,7 @@ class SpaceCat(commands.Bot):
         """Loads all modules from the modules folder for the bot."""
         # Enable enabled modules from list
         await self.add_cog(Core(self))
-        modules = module_handler.get_enabled()
+        modules = module_handler.get_enabled(self.instance)
         for module in modules:
             module_path = "spacecat.modules." + module
             try:
@@ -127,10 +128,12 @@ class Core(commands.Cog):
         # Output launch completion message
         console.message(self.bot.user.name + " has successfully launched")
         console.message(f"Bot ID: {self.bot.user.id}")
-        if module_handler.get_enabled():
-            console.message("Enabled Module(s): " f"{', '.join(module_handler.get_enabled())}")
-        if module_handler.get_disabled():
-            console.message("Disabled Module(s): " f"{', '.join(module_handler.get_disabled())}")
+        enabled_modules = module_handler.get_enabled(self.bot.instance)
+        disabled_modules = module_handler.get_disabled(self.bot.instance)
+        if enabled_modules:
+            console.message("Enabled Module(s): " f"{', '.join(enabled_modules)}")
+        if disabled_modules:
+            console.message("Disabled Module(s): " f"{', '.join(disabled_modules)}")
         console.message("--------------------")
 
         # Change status if specified in config
@@ -286,8 +289,8 @@ class Core(commands.Cog):
         if self.bot.user is None:
             return
 
-        enabled = module_handler.get_enabled()
-        disabled = module_handler.get_disabled()
+        enabled = module_handler.get_enabled(self.bot.instance)
+        disabled = module_handler.get_disabled(self.bot.instance)
 
         # Create embed
         embed = discord.Embed(
@@ -308,7 +311,7 @@ class Core(commands.Cog):
         self: Self, interaction: discord.Interaction, module: str | None = None
     ) -> None:
         """Reloads all or specified module."""
-        enabled_modules = module_handler.get_enabled()
+        enabled_modules = module_handler.get_enabled(self.bot.instance)
         modules_to_load = []
         failed_modules = []
 
@@ -373,6 +376,27 @@ class Core(commands.Cog):
 
         await interaction.response.send_message(embed=embed)
 
+    @app_commands.command()
+    @permissions.exclusive()
+    async def reloadconfig(self: Self, interaction: discord.Interaction) -> None:
+        """Reloads the config file after it has been edited by hand."""
+        try:
+            await self.bot.instance.reload_config()
+        except (FileNotFoundError, toml.TomlDecodeError):
+            embed = discord.Embed(
+                colour=constants.EmbedStatus.FAIL.value,
+                description="Failed to reload the config file. The current config is "
+                "still in use",
+            )
+            await interaction.response.send_message(embed=embed)
+            return
+
+        embed = discord.Embed(
+            colour=constants.EmbedStatus.YES.value,
+            description="Config reloaded successfully",
+        )
+        await interaction.response.send_message(embed=embed)
+
     @app_commands.command()
     @permissions.exclusive()
     async def enable(self: Self, interaction: discord.Interaction, module: str) -> None:
@@ -387,7 +411,7 @@ class Core(commands.Cog):
             return
 
         # Check config to see if module is already enabled
-        disabled_modules = module_handler.get_disabled()
+        disabled_modules = module_handler.get_disabled(self.bot.instance)
         if disabled_modules is None or module not in disabled_modules:
             embed = discord.Embed(
                 colour=constants.EmbedStatus.FAIL.value,
@@ -400,7 +424,7 @@ class Core(commands.Cog):
         await self.bot.load_extension(f"{constants.MAIN_DIR}.modules.{module}")
         config = self.bot.instance.get_config()
         config["base"]["disabled_modules"].remove(module)
-        self.bot.instance.save_config(config)
+        await self.bot.instance.save_config_async(config)
         embed = discord.Embed(
             colour=constants.EmbedStatus.YES.value, description=f"Module `{module}` enabled"
         )
@@ -420,26 +444,23 @@ class Core(commands.Cog):
             return
 
         # Check config to see if module is already disabled
-        disabled_modules = module_handler.get_disabled()
-        try:
-            if module in disabled_modules:
-                embed = discord.Embed(
-                    colour=constants.EmbedStatus.FAIL.value,
-                    description=f"Module `{module}` is already disabled",
-                )
-                await interaction.response.send_message(embed=embed)
-                return
-
-            # Add to list if list exists or create list if it doesn't
-            config = self.bot.instance.get_config()
-            config["base"]["disabled_modules"].append(module)
-        except TypeError:
-            config = self.bot.instance.get_config()
-            config["base"]["disabled_modules"] = [module]
+        disabled_modules = module_handler.get_disabled(self.bot.instance)
+        if disabled_modules is not None and module in disabled_modules:
+            embed = discord.Embed(
+                colour=constants.EmbedStatus.FAIL.value,
+                description=f"Module `{module}` is already disabled",
+            )
+            await interaction.response.send_message(embed=embed)
+            return
 
-        # Disable module and write to config
+        # Disable module and write to config, adding to the list if it exists
         await self.bot.unload_extension(f"{constants.MAIN_DIR}.modules.{module}")
-        self.bot.instance.save_config(config)
+        config = self.bot.instance.get_config()
+        if config["base"].get("disabled_modules") is None:
+            config["base"]["disabled_modules"] = [module]
+        else:
+            config["base"]["disabled_modules"].append(module)
+        await self.bot.instance.save_config_async(config)
         embed = discord.Embed(
             colour=constants.EmbedStatus.NO.value, description=f"Module `{module}` disabled"
         )
@@ -466,7 +487,6 @@ class Core(commands.Cog):
         if self.bot.user is None:
             return
 
-        config = self.bot.instance.get_config()
         confirm = None
 
         while confirm != "yes":
@@ -511,13 +531,15 @@ class Core(commands.Cog):
                 console.message("--------------------\n")
 
                 if confirm == "yes":
-                    config["base"]["adminuser"] = [idinput]
                     break
                 if confirm == "no":
                     break
                 continue
 
-        self.bot.instance.save_config(config)
+        # Read config after prompting so changes made in the meantime are kept
+        config = self.bot.instance.get_config()
+        config["base"]["adminuser"] = [idinput]
+        await self.bot.instance.save_config_async(config)
         await asyncio.sleep(1)
 
     async def _send_invite(self: Self) -> None:
@@ -547,7 +569,7 @@ class Core(commands.Cog):
         config["base"]["status"] = "online"
         config["base"]["activity_type"] = None
         config["base"]["activity_name"] = None
-        self.bot.instance.save_config(config)
+        await self.bot.instance.save_config_async(config)
 
 
 def introduction(instance: Instance) -> None: